@@ -6,6 +6,7 @@
 #   ./scripts/claude-agents-cli.sh sync
 #   ./scripts/claude-agents-cli.sh status
 #   ./scripts/claude-agents-cli.sh test
+#   ./scripts/claude-agents-cli.sh bench [--full|--profile|--save FILE|--compare FILE]
 #   ./scripts/claude-agents-cli.sh uninstall
 #   ./scripts/claude-agents-cli.sh help
 
@@ -64,11 +65,20 @@ ${BOLD}COMMANDS:${NC}
     ${GREEN}test${NC}        Test the context router and pool coordinator
                 Validates Python scripts work correctly
 
+    ${GREEN}bench${NC}       Benchmark hook latency on synthetic fixtures
+                --runs N        Measured runs per case (default: 20)
+                --full          Include largest fixtures (10^6-line pool)
+                --only TEXT     Only run cases matching TEXT
+                --profile [DIR] Write cProfile and -X importtime output
+                --save FILE     Save results as baseline JSON
+                --compare FILE  Compare against baseline (exit 1 on regression)
+
     ${GREEN}proxy${NC}       Start mcp-proxy server (requires Go installation)
                 --background  Run in background
 
     ${GREEN}obsidian${NC}    Setup Obsidian Vault MCP server
                 Configures @bitbonsai/mcpvault for your vault
+                --local-index  Use the local Python vault index instead
 
     ${GREEN}plugins${NC}     Show recommended plugins and skills
 
@@ -83,6 +93,7 @@ ${BOLD}EXAMPLES:${NC}
     ./scripts/claude-agents-cli.sh sync                 # Sync after git pull
     ./scripts/claude-agents-cli.sh status               # Check status
     ./scripts/claude-agents-cli.sh test                 # Test scripts
+    ./scripts/claude-agents-cli.sh bench --save base.json  # Benchmark hooks
     ./scripts/claude-agents-cli.sh obsidian             # Setup Obsidian vault
     ./scripts/claude-agents-cli.sh plugins              # Show recommended plugins
 
@@ -472,6 +483,23 @@ cmd_test() {
     fi
 }
 
+# ============================================================================
+# BENCH
+# ============================================================================
+
+cmd_bench() {
+    log_header "Benchmarking Hook Latency"
+    check_python
+
+    if [[ ! -d "$GLOBAL_SCRIPTS" ]]; then
+        log_error "Scripts not installed: $GLOBAL_SCRIPTS"
+        log_info "Run 'claude-agents-cli.sh install' first"
+        exit 1
+    fi
+
+    python3 "$SCRIPT_DIR/hook-bench.py" --scripts "$GLOBAL_SCRIPTS" "$@"
+}
+
 # ============================================================================
 # OBSIDIAN
 # ============================================================================
@@ -633,6 +661,7 @@ main() {
         sync)     cmd_sync "$@" ;;
         status)   cmd_status "$@" ;;
         test)     cmd_test "$@" ;;
+        bench)    cmd_bench "$@" ;;
         proxy)    cmd_proxy "$@" ;;
         obsidian) cmd_obsidian "$@" ;;
         plugins)  cmd_plugins "$@" ;;
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+hook-bench.py - Latency benchmark for the cognitive hook scripts.
+
+Builds synthetic fixtures (prompts, agent sets, pool files, memory graphs)
+in a throwaway HOME, runs each hook script many times against them and
+reports wall-time percentiles, import time, peak RSS and bytes read/written.
+
+Usage:
+    python3 scripts/hook-bench.py                       # Default sweep
+    python3 scripts/hook-bench.py --full                # Include 10^6-line pool, 200 KB prompts x 200 agents
+    python3 scripts/hook-bench.py --runs 50             # More samples per case
+    python3 scripts/hook-bench.py --only context-router # Filter cases by name
+    python3 scripts/hook-bench.py --save baseline.json  # Save results as baseline
+    python3 scripts/hook-bench.py --compare baseline.json
+    python3 scripts/hook-bench.py --profile             # cProfile + -X importtime dumps
+
+Cases whose script fails on every run are left out of --save/--compare and make
+the run exit non-zero. With --json, stdout carries only the JSON report.
+
+Only the standard library (Python 3.8+) is used. The user's real ~/.claude is
+never touched: every run gets HOME, CLAUDE_HOME and the working directory
+pointed at a fixture.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+DEFAULT_SCRIPTS = Path(os.environ.get("CLAUDE_HOME", Path.home() / ".claude")) / "scripts"
+
+PROMPT_SIZES = [100, 1_000, 10_000, 50_000, 200_000]
+AGENT_COUNTS = [15, 50, 200]
+POOL_SIZES = [1_000, 10_000, 100_000]
+POOL_SIZES_FULL = POOL_SIZES + [1_000_000]
+MEMORY_SIZES = [100, 1_000, 10_000]
+MEMORY_SIZES_FULL = MEMORY_SIZES + [50_000]
+
+BASE_AGENTS = 15
+BASE_PROMPT = 1_000
+TRANSCRIPT_TURNS = 200
+REGRESSION_THRESHOLD = 20.0  # percent
+
+WORDS = (
+    "resource module provider variable output plan apply state lock backend "
+    "bucket subnet route table instance cluster service task image build "
+    "error trace line file return value config deploy pipeline job stage"
+).split()
+
+TECH_TERMS = [
+    "terraform", "kubernetes", "docker", "aws", "azure", "github actions",
+    "security group", "load balancer", "postgresql", "redis", "prometheus",
+    "helm", "lambda", "vpc", "react", "fastapi",
+]
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def human_size(n):
+    """Format a byte/line count compactly (1000 -> 1K)."""
+    for unit, div in (("M", 1_000_000), ("K", 1_000)):
+        if n >= div:
+            return f"{n // div}{unit}"
+    return str(n)
+
+
+def make_prompt(size, rng):
+    """Build a prompt of roughly `size` bytes that looks like a pasted plan/trace."""
+    parts = []
+    total = 0
+    while total < size:
+        if rng.random() < 0.05:
+            word = rng.choice(TECH_TERMS)
+        else:
+            word = rng.choice(WORDS)
+        parts.append(word)
+        total += len(word) + 1
+        if rng.random() < 0.08:
+            parts.append("\n")
+    return " ".join(parts)[:size]
+
+
+def write_agents(claude_dir, count, rng):
+    """Write `count` agent files plus a keywords.json in the documented format."""
+    agents_dir = claude_dir / "agents"
+    agents_dir.mkdir(parents=True, exist_ok=True)
+
+    keywords = {}
+    co_activation = {}
+    names = [f"agents/agent-{i:03d}.md" for i in range(count)]
+
+    for i, name in enumerate(names):
+        terms = [TECH_TERMS[i % len(TECH_TERMS)], f"kw{i}", f"topic {i}"]
+        terms += [f"{rng.choice(WORDS)}{i}" for _ in range(5)]
+        keywords[name] = terms
+        co_activation[name] = rng.sample(names, k=min(3, count))
+
+        lines = [f"# Agent {i:03d}", "", f"Specialist for {', '.join(terms)}.", ""]
+        for section in range(12):
+            lines.append(f"## Section {section}")
+            lines.append("")
+            for _ in range(15):
+                lines.append(" ".join(rng.choice(WORDS) for _ in range(12)))
+            lines.append("")
+        (claude_dir / name).write_text("\n".join(lines))
+
+    config = {
+        "keywords": keywords,
+        "co_activation": co_activation,
+        "pinned": names[:1],
+        "thresholds": {"hot": 0.8, "warm": 0.25, "max_hot_files": 4, "max_chars": 25000},
+    }
+    (claude_dir / "keywords.json").write_text(json.dumps(config, indent=2))
+
+
+def write_pool(claude_dir, lines, rng):
+    """Write a synthetic instance_state.jsonl with `lines` signals from many instances."""
+    pool_dir = claude_dir / "pool"
+    pool_dir.mkdir(parents=True, exist_ok=True)
+    start = datetime.now(timezone.utc) - timedelta(days=30)
+    step = timedelta(days=30) / max(lines, 1)
+    instances = [chr(ord("A") + i) for i in range(12)]
+
+    with open(pool_dir / "instance_state.jsonl", "w") as f:
+        for i in range(lines):
+            signal = "blocker" if rng.random() < 0.1 else "completion"
+            entry = {
+                "timestamp": (start + step * i).isoformat(),
+                "instance_id": rng.choice(instances),
+                "type": signal,
+                "summary": " ".join(rng.choice(WORDS) for _ in range(10)),
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def write_memory(path, entities, rng):
+    """Write a memory graph in the MCP memory server's JSONL format."""
+    with open(path, "w") as f:
+        for i in range(entities):
+            entity = {
+                "type": "entity",
+                "name": f"entity-{i}",
+                "entityType": rng.choice(["project", "person", "service", "decision"]),
+                "observations": [
+                    " ".join(rng.choice(WORDS) for _ in range(14)) for _ in range(rng.randint(1, 6))
+                ],
+            }
+            f.write(json.dumps(entity) + "\n")
+        for i in range(entities):
+            relation = {
+                "type": "relation",
+                "from": f"entity-{i}",
+                "to": f"entity-{rng.randrange(entities)}",
+                "relationType": rng.choice(["depends_on", "owns", "relates_to"]),
+            }
+            f.write(json.dumps(relation) + "\n")
+
+
+def write_transcript(path, turns, rng):
+    """Write a session transcript (JSONL) whose last reply reports a completion and a blocker."""
+    with open(path, "w") as f:
+        for i in range(turns):
+            last = i == turns - 1
+            text = (
+                "Completed: migrated terraform state to the S3 backend.\n"
+                "Blocked: waiting on VPC peering approval."
+                if last else " ".join(rng.choice(WORDS) for _ in range(60))
+            )
+            f.write(json.dumps({"type": "user", "message": {
+                "role": "user", "content": " ".join(rng.choice(WORDS) for _ in range(20))}}) + "\n")
+            f.write(json.dumps({"type": "assistant", "message": {
+                "role": "assistant", "content": [{"type": "text", "text": text}]}}) + "\n")
+
+
+class Fixtures:
+    """Lazily-built fixture HOMEs, one per (agents, pool, memory) combination."""
+
+    def __init__(self, root, seed=1337):
+        self.root = Path(root)
+        self.seed = seed
+        self._homes = {}
+
+    def home(self, agents=BASE_AGENTS, pool=0, memory=0):
+        key = (agents, pool, memory)
+        if key in self._homes:
+            return self._homes[key]
+
+        rng = random.Random(self.seed)
+        home = self.root / f"home-a{agents}-p{pool}-m{memory}"
+        claude_dir = home / ".claude"
+        claude_dir.mkdir(parents=True)
+        write_agents(claude_dir, agents, rng)
+        write_pool(claude_dir, pool, rng)
+        if memory:
+            write_memory(claude_dir / "memory.json", memory, rng)
+
+        self._homes[key] = home
+        return home
+
+    def stop_file(self):
+        """Stop hook payload pointing at a shared synthetic transcript."""
+        path = self.root / "stop.json"
+        if not path.exists():
+            transcript = self.root / "transcript.jsonl"
+            write_transcript(transcript, TRANSCRIPT_TURNS, random.Random(self.seed))
+            path.write_text(json.dumps({
+                "session_id": "bench",
+                "transcript_path": str(transcript),
+                "hook_event_name": "Stop",
+                "stop_hook_active": False,
+            }))
+        return path
+
+    def prompt_file(self, size):
+        path = self.root / f"prompt-{size}.json"
+        if not path.exists():
+            rng = random.Random(self.seed + size)
+            path.write_text(json.dumps({"prompt": make_prompt(size, rng)}))
+        return path
+
+
+# ============================================================================
+# CASES
+# ============================================================================
+
+def build_cases(fixtures, full=False):
+    """Return (name, script, args, home_key, stdin_path) tuples for the sweep."""
+    cases = []
+    empty = fixtures.prompt_file(0)
+
+    for size in PROMPT_SIZES:
+        cases.append((f"context-router prompt={human_size(size)}B agents={BASE_AGENTS}",
+                      "context-router.py", [], (BASE_AGENTS, 0, 0), fixtures.prompt_file(size)))
+
+    for count in AGENT_COUNTS:
+        if count == BASE_AGENTS:
+            continue
+        cases.append((f"context-router prompt={human_size(BASE_PROMPT)}B agents={count}",
+                      "context-router.py", [], (count, 0, 0), fixtures.prompt_file(BASE_PROMPT)))
+    if full:
+        cases.append((f"context-router prompt=200KB agents={AGENT_COUNTS[-1]}",
+                      "context-router.py", [], (AGENT_COUNTS[-1], 0, 0), fixtures.prompt_file(200_000)))
+
+    for lines in (POOL_SIZES_FULL if full else POOL_SIZES):
+        label = human_size(lines)
+        cases.append((f"pool-loader pool={label}", "pool-loader.py", [], (BASE_AGENTS, lines, 0), empty))
+        cases.append((f"pool-query --count pool={label}", "pool-query.py", ["--count"],
+                      (BASE_AGENTS, lines, 0), empty))
+        cases.append((f"pool-query --recent 5 pool={label}", "pool-query.py", ["--recent", "5"],
+                      (BASE_AGENTS, lines, 0), empty))
+        # Appends to the pool fixture, which grows by at most one entry per run
+        cases.append((f"pool-extractor pool={label}", "pool-extractor.py", [],
+                      (BASE_AGENTS, lines, 0), fixtures.stop_file()))
+
+    for entities in (MEMORY_SIZES_FULL if full else MEMORY_SIZES):
+        cases.append((f"memory-manager stats entities={human_size(entities)}", "memory-manager.py",
+                      ["stats"], (BASE_AGENTS, 0, entities), empty))
+
+    return cases
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def child_env(home):
+    env = os.environ.copy()
+    env["HOME"] = str(home)
+    env["CLAUDE_HOME"] = str(home / ".claude")
+    env["CLAUDE_INSTANCE"] = "bench"
+    env["MCP_MEMORY_PATH"] = str(home / ".claude" / "memory.json")
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def read_proc_io(pid):
+    """Return (rchar, wchar) for an exited-but-unreaped child, or (None, None)."""
+    try:
+        fields = dict(
+            line.split(": ", 1) for line in Path(f"/proc/{pid}/io").read_text().splitlines()
+        )
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+def exit_code(status):
+    """Decode a wait status like Popen does (os.waitstatus_to_exitcode is 3.9+)."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def run_once(cmd, home, stdin_path):
+    """Run one hook invocation; return (seconds, exit_code, maxrss_kb, rchar, wchar)."""
+    with open(stdin_path, "rb") as stdin:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdin=stdin, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, cwd=home, env=child_env(home))
+        rchar = wchar = None
+        if hasattr(os, "waitid"):
+            # Wait without reaping so /proc/<pid>/io is still readable
+            os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+            elapsed = time.perf_counter() - start
+            rchar, wchar = read_proc_io(proc.pid)
+            _, status, usage = os.wait4(proc.pid, 0)
+        else:
+            _, status, usage = os.wait4(proc.pid, 0)
+            elapsed = time.perf_counter() - start
+        proc.returncode = exit_code(status)
+
+    maxrss = usage.ru_maxrss
+    if sys.platform == "darwin":
+        maxrss //= 1024  # bytes on macOS, KB elsewhere
+    return elapsed, proc.returncode, maxrss, rchar, wchar
+
+
+def import_time_ms(script, args, home, stdin_path):
+    """Total cumulative time of top-level imports reported by -X importtime."""
+    with open(stdin_path, "rb") as stdin:
+        result = subprocess.run([sys.executable, "-X", "importtime", str(script), *args],
+                                stdin=stdin, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                cwd=home, env=child_env(home), text=True)
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        if not parts[2].startswith("  "):  # only top-level imports (" name")
+            total_us += int(parts[1])
+    return round(total_us / 1000, 2), result.stderr
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def bench_case(script, args, home, stdin_path, runs, warmup):
+    cmd = [sys.executable, str(script), *args]
+    for _ in range(warmup):
+        run_once(cmd, home, stdin_path)
+
+    times, rss, reads, writes, failures = [], [], [], [], 0
+    for _ in range(runs):
+        elapsed, code, maxrss, rchar, wchar = run_once(cmd, home, stdin_path)
+        times.append(elapsed * 1000)
+        rss.append(maxrss)
+        if rchar is not None:
+            reads.append(rchar)
+            writes.append(wchar)
+        if code != 0:
+            failures += 1
+
+    times.sort()
+    imp_ms, _ = import_time_ms(script, args, home, stdin_path)
+    return {
+        "runs": runs,
+        "failures": failures,
+        "p50_ms": round(percentile(times, 50), 2),
+        "p95_ms": round(percentile(times, 95), 2),
+        "p99_ms": round(percentile(times, 99), 2),
+        "import_ms": imp_ms,
+        "max_rss_kb": max(rss),
+        "read_bytes": max(reads) if reads else None,
+        "write_bytes": max(writes) if writes else None,
+    }
+
+
+def profile_case(name, script, args, home, stdin_path, out_dir):
+    """Dump cProfile stats and -X importtime output for one case."""
+    slug = "".join(c if c.isalnum() else "_" for c in name).strip("_")
+    prof_path = out_dir / f"{slug}.prof"
+    with open(stdin_path, "rb") as stdin:
+        subprocess.run([sys.executable, "-m", "cProfile", "-o", str(prof_path), str(script), *args],
+                       stdin=stdin, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       cwd=home, env=child_env(home))
+    _, raw = import_time_ms(script, args, home, stdin_path)
+    (out_dir / f"{slug}.importtime.txt").write_text(raw)
+    return prof_path
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def fmt(value, suffix=""):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.1f}{suffix}"
+    return f"{value}{suffix}"
+
+
+def print_results(results):
+    header = f"{'case':<48} {'p50':>9} {'p95':>9} {'p99':>9} {'import':>8} {'rss':>9} {'read':>9} {'write':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        read = human_size(r["read_bytes"]) if r["read_bytes"] is not None else "-"
+        write = human_size(r["write_bytes"]) if r["write_bytes"] is not None else "-"
+        flag = f"  ({r['failures']} failed)" if r["failures"] else ""
+        print(f"{name:<48} {fmt(r['p50_ms'], 'ms'):>9} {fmt(r['p95_ms'], 'ms'):>9} "
+              f"{fmt(r['p99_ms'], 'ms'):>9} {fmt(r['import_ms'], 'ms'):>8} "
+              f"{r['max_rss_kb'] / 1024:>7.1f}MB {read:>9} {write:>8}{flag}")
+
+
+def compare_results(results, baseline, threshold, out=sys.stdout):
+    """Print p50/p95 deltas against a saved baseline; return number of regressions."""
+    regressions = 0
+    base = baseline.get("results", {})
+    print(f"\nComparison with baseline ({baseline.get('timestamp', '?')}, threshold {threshold:.0f}%):", file=out)
+    for name, r in results.items():
+        if name not in base:
+            print(f"  {name:<48} new case", file=out)
+            continue
+        deltas = []
+        for key in ("p50_ms", "p95_ms"):
+            old, new = base[name].get(key), r.get(key)
+            if not old or new is None:
+                continue
+            pct = (new - old) / old * 100
+            marker = ""
+            if pct > threshold:
+                marker = " REGRESSION"
+                regressions += 1
+            deltas.append(f"{key[:3]} {old:.1f}->{new:.1f}ms ({pct:+.0f}%){marker}")
+        print(f"  {name:<48} " + "  ".join(deltas), file=out)
+    return regressions
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cognitive hook scripts")
+    parser.add_argument("--scripts", type=Path, default=DEFAULT_SCRIPTS,
+                        help=f"Directory with hook scripts (default: {DEFAULT_SCRIPTS})")
+    parser.add_argument("--runs", type=int, default=20, help="Measured runs per case (default: 20)")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured warmup runs per case")
+    parser.add_argument("--full", action="store_true", help="Include the largest fixtures (slow)")
+    parser.add_argument("--only", help="Only run cases whose name contains this string")
+    parser.add_argument("--profile", nargs="?", const="bench-profile", metavar="DIR",
+                        help="Write cProfile and -X importtime output to DIR (default: bench-profile)")
+    parser.add_argument("--save", metavar="FILE", help="Save results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="FILE", help="Compare results against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help=f"Regression threshold in percent (default: {REGRESSION_THRESHOLD:.0f})")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--keep-fixtures", action="store_true", help="Do not delete the fixture directory")
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    # Children run with cwd set to a fixture HOME, so relative paths would not resolve
+    args.scripts = args.scripts.resolve()
+    if not args.scripts.is_dir():
+        print(f"Scripts directory not found: {args.scripts}", file=sys.stderr)
+        sys.exit(1)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    profile_dir = None
+    if args.profile:
+        profile_dir = Path(args.profile)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+    root = Path(tempfile.mkdtemp(prefix="claude-hook-bench-"))
+    results = {}
+    try:
+        fixtures = Fixtures(root)
+        for name, script_name, script_args, home_key, stdin_path in build_cases(fixtures, args.full):
+            if args.only and args.only not in name:
+                continue
+            script = args.scripts / script_name
+            if not script.is_file():
+                print(f"[!] Skipping {name}: {script} not found", file=sys.stderr)
+                continue
+
+            print(f"[→] {name}", file=sys.stderr)
+            home = fixtures.home(*home_key)
+            results[name] = bench_case(script, script_args, home, stdin_path, args.runs, args.warmup)
+            if profile_dir:
+                profile_case(name, script, script_args, home, stdin_path, profile_dir)
+    finally:
+        if args.keep_fixtures:
+            print(f"[!] Fixtures kept in {root}", file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    # Timings of a script that never succeeds only measure interpreter startup
+    broken = [name for name, r in results.items() if r["failures"] == r["runs"]]
+    valid = {name: r for name, r in results.items() if name not in broken}
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "results": valid,
+    }
+
+    # Keep stdout machine-readable with --json; everything else goes to stderr
+    out = sys.stderr if args.json else sys.stdout
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print()
+        print_results(results)
+
+    if broken:
+        print(f"\n[✗] {len(broken)} case(s) failed on every run and are excluded from --save/--compare:",
+              file=sys.stderr)
+        for name in broken:
+            print(f"    {name}", file=sys.stderr)
+
+    if profile_dir:
+        print(f"\nProfiles written to {profile_dir}/ (view with: python3 -m pstats <file>.prof)", file=out)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nBaseline saved: {args.save}", file=out)
+
+    regressions = compare_results(valid, baseline, args.threshold, out) if baseline is not None else 0
+    if broken or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@
 # Uso:
 #   ./scripts/setup-obsidian.sh                    # Setup interactivo
 #   ./scripts/setup-obsidian.sh /path/to/vault     # Setup con path directo
+#   ./scripts/setup-obsidian.sh --local-index      # Usa el indice local en Python (sin npx)
 
 set -euo pipefail
 
@@ -28,14 +29,30 @@ echo -e "${BOLD}${CYAN}║   Obsidian Vault MCP Setup               ║${NC}"
 echo -e "${BOLD}${CYAN}╚══════════════════════════════════════════╝${NC}"
 echo ""
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_DIR="$(dirname "$SCRIPT_DIR")"
+VAULT_INDEX="$SCRIPT_DIR/vault-index.py"
+
+# Parse arguments
+LOCAL_INDEX=false
+VAULT_PATH=""
+for arg in "$@"; do
+    case "$arg" in
+        --local-index) LOCAL_INDEX=true ;;
+        *) VAULT_PATH="$arg" ;;
+    esac
+done
+
 # Check prerequisites
-if ! command -v npx &> /dev/null; then
-    log_error "npx not found. Install Node.js first: https://nodejs.org"
-    exit 1
+if [[ "$LOCAL_INDEX" == false ]] && ! command -v npx &> /dev/null; then
+    log_warn "npx not found. Falling back to the local Python vault index (--local-index)."
+    LOCAL_INDEX=true
 fi
 
-# Get vault path
-VAULT_PATH="${1:-}"
+if [[ "$LOCAL_INDEX" == true ]] && ! command -v python3 &> /dev/null; then
+    log_error "python3 not found. Install Python 3.8+ or Node.js (for npx)."
+    exit 1
+fi
 
 if [[ -z "$VAULT_PATH" ]]; then
     echo -e "${BOLD}Enter the path to your Obsidian vault:${NC}"
@@ -65,16 +82,31 @@ fi
 
 log_info "Vault found: $VAULT_PATH"
 
-# Pre-install the MCP package
-log_step "Installing @bitbonsai/mcpvault..."
-npx -y @bitbonsai/mcpvault@latest --help > /dev/null 2>&1 || {
-    log_warn "Could not verify mcpvault package. It will be downloaded on first use."
-}
-log_info "mcpvault package ready"
+# MCP server command (written into the Python snippets below)
+if [[ "$LOCAL_INDEX" == true ]]; then
+    MCP_SERVER="local vault index ($VAULT_INDEX)"
+    MCP_COMMAND="python3"
+    MCP_ARGS="['$VAULT_INDEX', 'serve', '--vault', vault_path]"
+
+    log_step "Building local vault index (first build: ~2s per 1,000 notes)..."
+    python3 "$VAULT_INDEX" build --vault "$VAULT_PATH" || {
+        log_error "Failed to build vault index"
+        exit 1
+    }
+else
+    MCP_SERVER="@bitbonsai/mcpvault@latest"
+    MCP_COMMAND="npx"
+    MCP_ARGS="['-y', '@bitbonsai/mcpvault@latest', vault_path]"
+
+    # Pre-install the MCP package
+    log_step "Installing @bitbonsai/mcpvault..."
+    npx -y @bitbonsai/mcpvault@latest --help > /dev/null 2>&1 || {
+        log_warn "Could not verify mcpvault package. It will be downloaded on first use."
+    }
+    log_info "mcpvault package ready"
+fi
 
 # Determine MCP config location
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-REPO_DIR="$(dirname "$SCRIPT_DIR")"
 MCP_CONFIG="$REPO_DIR/.mcp.json"
 
 if [[ ! -f "$MCP_CONFIG" ]]; then
@@ -99,8 +131,8 @@ servers = config.get('mcpServers', {})
 
 servers['obsidian-vault'] = {
     'type': 'stdio',
-    'command': 'npx',
-    'args': ['-y', '@bitbonsai/mcpvault@latest', vault_path]
+    'command': '$MCP_COMMAND',
+    'args': $MCP_ARGS
 }
 
 config['mcpServers'] = servers
@@ -139,8 +171,8 @@ servers = config.get('mcpServers', {})
 
 servers['obsidian-vault'] = {
     'type': 'stdio',
-    'command': 'npx',
-    'args': ['-y', '@bitbonsai/mcpvault@latest', vault_path]
+    'command': '$MCP_COMMAND',
+    'args': $MCP_ARGS
 }
 
 config['mcpServers'] = servers
@@ -161,8 +193,8 @@ config = {
     'mcpServers': {
         'obsidian-vault': {
             'type': 'stdio',
-            'command': 'npx',
-            'args': ['-y', '@bitbonsai/mcpvault@latest', vault_path]
+            'command': '$MCP_COMMAND',
+            'args': $MCP_ARGS
         }
     }
 }
@@ -711,6 +743,10 @@ _How does it impact your work or understanding?_
 
     log_info "Templates created (7 templates)"
     log_info "Vault structure complete!"
+
+    if [[ "$LOCAL_INDEX" == true ]]; then
+        python3 "$VAULT_INDEX" build --vault "$VAULT_PATH" --quiet
+    fi
 fi
 
 # Summary
@@ -720,14 +756,25 @@ echo -e "${BOLD}${CYAN}║   Setup Complete!                        ║${NC}"
 echo -e "${BOLD}${CYAN}╚══════════════════════════════════════════╝${NC}"
 echo ""
 log_info "Vault path: $VAULT_PATH"
-log_info "MCP server: @bitbonsai/mcpvault@latest"
+log_info "MCP server: $MCP_SERVER"
 echo ""
 echo -e "${BOLD}Available tools in Claude Code:${NC}"
-echo "  - read_note / write_note — Read and write notes"
-echo "  - search_notes — Search vault by content"
-echo "  - list_directory — Browse vault structure"
-echo "  - get_vault_stats — Vault statistics"
-echo "  - manage_tags — Tag management"
+if [[ "$LOCAL_INDEX" == true ]]; then
+    echo "  - search_notes — Search vault by title, tags, headings and content"
+    echo "  - read_note — Read a note"
+    echo "  - get_vault_stats — Index statistics"
+    echo ""
+    echo -e "${BOLD}Optional: inject related notes into every prompt${NC}"
+    echo "  Add these hooks to .claude/settings.json:"
+    echo "    SessionStart:     python3 $VAULT_INDEX build --quiet"
+    echo "    UserPromptSubmit: python3 $VAULT_INDEX hook"
+else
+    echo "  - read_note / write_note — Read and write notes"
+    echo "  - search_notes — Search vault by content"
+    echo "  - list_directory — Browse vault structure"
+    echo "  - get_vault_stats — Vault statistics"
+    echo "  - manage_tags — Tag management"
+fi
 echo ""
 log_info "Restart Claude Code to activate the MCP server"
 echo ""
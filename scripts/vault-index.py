@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+vault-index.py - Local, incremental search index for an Obsidian vault.
+
+Keeps a persistent inverted index (SQLite, stdlib only) of note titles, tags,
+headings and body terms. Only notes whose mtime or size changed are re-parsed
+on rebuild, so refreshing a vault with thousands of notes is mostly stat calls.
+
+Usage:
+    python3 scripts/vault-index.py build [--vault PATH]     # Create/refresh the index
+    python3 scripts/vault-index.py query "terraform state"  # Search from the shell
+    python3 scripts/vault-index.py stats                    # Index statistics
+    python3 scripts/vault-index.py hook                     # UserPromptSubmit hook (stdin JSON)
+    python3 scripts/vault-index.py serve [--vault PATH]     # stdio MCP server
+
+The vault defaults to $OBSIDIAN_VAULT_PATH, or to the vault recorded in the index.
+The index lives in $CLAUDE_HOME/vault-index.db (default: ~/.claude/vault-index.db).
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+CLAUDE_HOME = Path(os.environ.get("CLAUDE_HOME", Path.home() / ".claude"))
+DEFAULT_INDEX = CLAUDE_HOME / "vault-index.db"
+
+SERVER_NAME = "claude-agents-vault-index"
+SERVER_VERSION = "1.0.0"
+PROTOCOL_VERSION = "2024-11-05"
+SUPPORTED_PROTOCOL_VERSIONS = (PROTOCOL_VERSION,)
+
+# Field weights: a term in the title says more about a note than one in the body
+WEIGHT_TITLE = 5.0
+WEIGHT_TAG = 4.0
+WEIGHT_HEADING = 2.0
+BODY_TF_CAP = 5
+
+MAX_QUERY_TERMS = 48
+MAX_TERM_LENGTH = 40
+COMMON_TERM_RATIO = 0.5  # Ignore query terms present in more than half the notes
+REFRESH_INTERVAL = 30  # Seconds between incremental refreshes in serve mode
+LOCK_TIMEOUT = 120  # Seconds a writer waits for another instance's rebuild to finish
+
+HOOK_LIMIT = 3
+HOOK_MAX_CHARS = 2000
+HOOK_BUDGET_MS = 150
+
+TOKEN_RE = re.compile(r"\w[\w-]*\w", re.UNICODE)
+HEADING_RE = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+INLINE_TAG_RE = re.compile(r"(?<![\w/&#])#([^\W\d][\w/-]*)", re.UNICODE)
+
+STOPWORDS = frozenset("""
+    a an and are as at be but by can do does for from has have how i if in into is it its
+    me my no not of on or our so than that the their them then there these this to was we
+    were what when where which who why will with you your
+    al como con de del el en es la las lo los para por que se su un una y
+""".split())
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords, pure numbers or very long strings."""
+    return [
+        token for token in TOKEN_RE.findall(text.lower())
+        if len(token) <= MAX_TERM_LENGTH and token not in STOPWORDS and not token.isdigit()
+    ]
+
+
+def split_frontmatter(text):
+    """Return (frontmatter, body) for a note with an optional YAML header."""
+    if text.startswith("---\n"):
+        end = text.find("\n---", 4)
+        if end != -1:
+            body_start = text.find("\n", end + 4)
+            return text[4:end], text[body_start + 1:] if body_start != -1 else ""
+    return "", text
+
+
+def frontmatter_tags(frontmatter):
+    """Extract tags from `tags: [a, b]`, `tags: a, b` or a `tags:` block list."""
+    tags = []
+    in_list = False
+    for line in frontmatter.splitlines():
+        stripped = line.strip()
+        if in_list:
+            if stripped.startswith("- "):
+                tags.append(stripped[2:].strip().strip("'\"#"))
+                continue
+            in_list = False
+        if stripped.startswith("tags:"):
+            value = stripped[5:].strip().strip("[]")
+            if value:
+                tags.extend(t.strip().strip("'\"#") for t in value.split(","))
+            else:
+                in_list = True
+    return [t for t in tags if t]
+
+
+def parse_note(text):
+    """Split a note into tags, headings and body text (code fences excluded from headings)."""
+    frontmatter, body = split_frontmatter(text)
+    tags = frontmatter_tags(frontmatter)
+    headings = []
+    in_fence = False
+
+    for line in body.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = HEADING_RE.match(line)
+        if match:
+            headings.append(match.group(1))
+            continue
+        tags.extend(INLINE_TAG_RE.findall(line))
+
+    seen = set()
+    unique_tags = [t for t in tags if not (t.lower() in seen or seen.add(t.lower()))]
+    return unique_tags, headings, body
+
+
+def note_postings(title, tags, headings, body):
+    """Compute term -> weight for one note."""
+    weights = Counter({term: min(tf, BODY_TF_CAP) for term, tf in Counter(tokenize(body)).items()})
+    for term in set(tokenize(" ".join(headings))):
+        weights[term] += WEIGHT_HEADING
+    for tag in tags:
+        # Index "devops/aws" as the full tag and as its parts
+        for term in {tag.lower(), *tokenize(tag.replace("/", " "))}:
+            weights[term] += WEIGHT_TAG
+    for term in set(tokenize(title)):
+        weights[term] += WEIGHT_TITLE
+    return weights
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    headings TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    note_id INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (term, note_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_note ON postings(note_id);
+"""
+
+
+class VaultIndex:
+    """Persistent inverted index over the Markdown notes of one vault."""
+
+    def __init__(self, index_path=DEFAULT_INDEX, readonly=False):
+        self.index_path = Path(index_path)
+        if readonly:
+            # Escape the path: '#', '?' or '%' in CLAUDE_HOME would otherwise be parsed as URI syntax
+            self.db = sqlite3.connect(self.index_path.resolve().as_uri() + "?mode=ro", uri=True)
+        else:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(self.index_path, timeout=LOCK_TIMEOUT)
+            # WAL lets the per-prompt hook read while a rebuild is writing
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("PRAGMA cache_size=-65536")  # 64 MB, keeps postings B-tree inserts in memory
+            self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def meta(self, key, default=None):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    @property
+    def vault(self):
+        path = self.meta("vault")
+        return Path(path) if path else None
+
+    # -- Build -------------------------------------------------------------
+
+    @staticmethod
+    def scan(vault):
+        """Yield (relative_path, mtime, size) for every note, skipping dot-directories."""
+        for root, dirs, files in os.walk(vault):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in files:
+                if not name.endswith(".md"):
+                    continue
+                full = os.path.join(root, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                yield os.path.relpath(full, vault), st.st_mtime, st.st_size
+
+    def build(self, vault, wait=True):
+        """Incrementally sync the index with the vault; return change counts.
+
+        With wait=False, raises sqlite3.OperationalError right away if another
+        process is already rebuilding instead of waiting for it.
+        """
+        vault = Path(vault).expanduser().resolve()
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        if not wait:
+            self.db.execute("PRAGMA busy_timeout = 0")
+        try:
+            self._build(vault, stats)
+        finally:
+            if not wait:
+                self.db.execute(f"PRAGMA busy_timeout = {LOCK_TIMEOUT * 1000}")
+        return stats
+
+    def _build(self, vault, stats):
+        with self.db:
+            # Take the write lock before reading `known`, so concurrent builds
+            # (several SessionStart hooks, serve refreshes) never diff stale state
+            self.db.execute("BEGIN IMMEDIATE")
+            if self.vault != vault:
+                # Different vault: nothing in the index is reusable
+                self.db.execute("DELETE FROM postings")
+                self.db.execute("DELETE FROM notes")
+                self._set_meta("vault", vault)
+
+            known = {
+                path: (note_id, mtime, size)
+                for note_id, path, mtime, size in self.db.execute("SELECT id, path, mtime, size FROM notes")
+            }
+            seen = set()
+
+            # Full rebuild: stage postings in an unindexed table, then copy them into
+            # the primary-key B-tree in term order and index note_id afterwards.
+            # Much faster than per-note inserts in random term order.
+            bulk = not known
+            if bulk:
+                self.db.execute("DROP INDEX IF EXISTS postings_note")
+                self.db.execute("CREATE TEMP TABLE IF NOT EXISTS postings_stage (term TEXT, note_id INTEGER, weight REAL)")
+
+            for rel_path, mtime, size in self.scan(vault):
+                seen.add(rel_path)
+                existing = known.get(rel_path)
+                if existing and existing[1] == mtime and existing[2] == size:
+                    stats["unchanged"] += 1
+                    continue
+                try:
+                    text = (vault / rel_path).read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+                self._store_note(rel_path, mtime, size, text, existing[0] if existing else None, bulk)
+                stats["updated" if existing else "added"] += 1
+
+            if bulk:
+                self.db.execute("INSERT INTO postings SELECT term, note_id, weight FROM postings_stage ORDER BY term, note_id")
+                self.db.execute("DROP TABLE postings_stage")
+                self.db.execute("CREATE INDEX IF NOT EXISTS postings_note ON postings(note_id)")
+
+            for rel_path in known.keys() - seen:
+                note_id = known[rel_path][0]
+                self.db.execute("DELETE FROM postings WHERE note_id = ?", (note_id,))
+                self.db.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+                stats["removed"] += 1
+
+            self._set_meta("note_count", len(seen))
+            self._set_meta("built_at", time.time())
+
+    def _store_note(self, rel_path, mtime, size, text, note_id, bulk=False):
+        title = Path(rel_path).stem
+        tags, headings, body = parse_note(text)
+        row = (rel_path, mtime, size, title, json.dumps(tags), json.dumps(headings))
+
+        if note_id is None:
+            note_id = self.db.execute(
+                "INSERT INTO notes (path, mtime, size, title, tags, headings) VALUES (?, ?, ?, ?, ?, ?)", row
+            ).lastrowid
+        else:
+            self.db.execute(
+                "UPDATE notes SET path = ?, mtime = ?, size = ?, title = ?, tags = ?, headings = ? WHERE id = ?",
+                (*row, note_id),
+            )
+            self.db.execute("DELETE FROM postings WHERE note_id = ?", (note_id,))
+
+        table = "postings_stage" if bulk else "postings"
+        self.db.executemany(
+            f"INSERT INTO {table} (term, note_id, weight) VALUES (?, ?, ?)",
+            ((term, note_id, weight) for term, weight in note_postings(title, tags, headings, body).items()),
+        )
+
+    # -- Query -------------------------------------------------------------
+
+    def search(self, text, limit=5):
+        """Rank notes for free text; return dicts with path, title, tags, score and matched terms."""
+        terms = [t for t, _ in Counter(tokenize(text)).most_common(MAX_QUERY_TERMS)]
+        total = int(self.meta("note_count", 0) or 0)
+        if not terms or not total:
+            return []
+
+        placeholders = ",".join("?" * len(terms))
+        df = dict(self.db.execute(
+            f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term", terms
+        ))
+        # Very common terms match everything and only cost time; skip them unless the vault is tiny
+        idf = {
+            term: math.log(1 + total / count)
+            for term, count in df.items()
+            if total < 20 or count <= total * COMMON_TERM_RATIO
+        }
+        if not idf:
+            return []
+
+        scores = Counter()
+        matched = {}
+        placeholders = ",".join("?" * len(idf))
+        for term, note_id, weight in self.db.execute(
+            f"SELECT term, note_id, weight FROM postings WHERE term IN ({placeholders})", list(idf)
+        ):
+            scores[note_id] += weight * idf[term]
+            matched.setdefault(note_id, []).append(term)
+
+        results = []
+        for note_id, score in scores.most_common(limit):
+            path, title, tags = self.db.execute(
+                "SELECT path, title, tags FROM notes WHERE id = ?", (note_id,)
+            ).fetchone()
+            results.append({
+                "path": path,
+                "title": title,
+                "tags": json.loads(tags),
+                "score": round(score, 3),
+                "terms": matched[note_id],
+            })
+        return results
+
+    def excerpt(self, path, terms, max_chars):
+        """Best-matching paragraph of a note, trimmed to max_chars."""
+        vault = self.vault
+        try:
+            text = (vault / path).read_text(encoding="utf-8", errors="replace")
+        except (OSError, TypeError):
+            return ""
+        _, body = split_frontmatter(text)
+        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", body) if p.strip()]
+        if not paragraphs or max_chars <= 0:
+            return ""
+
+        wanted = set(terms)
+        best = max(paragraphs, key=lambda p: len(wanted.intersection(tokenize(p))))
+        if len(best) > max_chars:
+            best = best[:max(max_chars - 2, 0)].rsplit(" ", 1)[0] + " …"
+        return best
+
+    def stats(self):
+        notes = self.db.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+        terms = self.db.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+        built_at = self.meta("built_at")
+        return {
+            "vault": str(self.vault) if self.vault else None,
+            "index": str(self.index_path),
+            "notes": notes,
+            "terms": terms,
+            "built_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(built_at))) if built_at else None,
+        }
+
+
+def resolve_vault(args, index=None):
+    if args.vault:
+        return Path(args.vault).expanduser().resolve()
+    if os.environ.get("OBSIDIAN_VAULT_PATH"):
+        return Path(os.environ["OBSIDIAN_VAULT_PATH"]).expanduser().resolve()
+    if index is not None and index.vault:
+        return index.vault
+    return None
+
+
+# ============================================================================
+# HOOK
+# ============================================================================
+
+def format_context(index, results, max_chars):
+    """Render search results as a context block capped at max_chars."""
+    header = "## Related Vault Notes\n"
+    per_note = max(200, (max_chars - len(header)) // max(len(results), 1))
+    blocks = []
+    used = len(header)
+
+    for result in results:
+        title_line = f"\n### {result['title']} (`{result['path']}`)\n"
+        if len(title_line) > per_note // 2:
+            title_line = title_line[:per_note // 2 - 2] + "…\n"
+        budget = max(0, min(per_note, max_chars - used) - len(title_line))
+        excerpt = index.excerpt(result["path"], result["terms"], budget)
+        block = title_line + (excerpt + "\n" if excerpt else "")
+        if used + len(block) > max_chars:
+            continue  # A smaller note further down may still fit
+        blocks.append(block)
+        used += len(block)
+
+    return header + "".join(blocks) if blocks else ""
+
+
+def cmd_hook(args):
+    """UserPromptSubmit hook: print excerpts of the notes most related to the prompt."""
+    start = time.perf_counter()
+    try:
+        prompt = json.load(sys.stdin).get("prompt", "")
+    except (json.JSONDecodeError, AttributeError):
+        return
+    if not prompt or not Path(args.index).exists():
+        return
+
+    try:
+        index = VaultIndex(args.index, readonly=True)
+    except sqlite3.Error:
+        return
+    try:
+        results = index.search(prompt, limit=args.limit)
+        # Reading excerpts is the only part that touches the vault; skip it when over budget
+        if results and (time.perf_counter() - start) * 1000 < args.budget_ms:
+            output = format_context(index, results, args.max_chars)
+            if output:
+                print(output)
+    except sqlite3.Error:
+        pass
+    finally:
+        index.close()
+
+
+# ============================================================================
+# MCP SERVER
+# ============================================================================
+
+TOOLS = [
+    {
+        "name": "search_notes",
+        "description": "Search the Obsidian vault by title, tags, headings and content. Returns ranked notes with an excerpt.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Free-text search query"},
+                "limit": {"type": "integer", "description": "Maximum number of notes (default 10)"},
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "read_note",
+        "description": "Read the full content of a note by its vault-relative path.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {"path": {"type": "string", "description": "Path relative to the vault root"}},
+            "required": ["path"],
+        },
+    },
+    {
+        "name": "get_vault_stats",
+        "description": "Show vault index statistics (notes, distinct terms, last refresh).",
+        "inputSchema": {"type": "object", "properties": {}},
+    },
+]
+
+
+class McpServer:
+    """Minimal MCP server (JSON-RPC 2.0 over newline-delimited stdio) exposing the index."""
+
+    def __init__(self, index, vault):
+        self.index = index
+        self.vault = Path(vault).expanduser().resolve()
+        self.last_refresh = 0.0
+
+    def refresh(self, force=False):
+        if force or time.time() - self.last_refresh > REFRESH_INTERVAL:
+            try:
+                self.index.build(self.vault, wait=False)
+            except sqlite3.OperationalError:
+                return  # Another instance is refreshing; search the current index
+            self.last_refresh = time.time()
+
+    def tool_search_notes(self, arguments):
+        self.refresh()
+        limit = int(arguments.get("limit") or 10)
+        results = self.index.search(arguments.get("query", ""), limit=limit)
+        if not results:
+            return "No matching notes."
+        lines = []
+        for result in results:
+            tags = f" [{', '.join(result['tags'])}]" if result["tags"] else ""
+            lines.append(f"## {result['title']} ({result['path']}){tags} score={result['score']}")
+            lines.append(self.index.excerpt(result["path"], result["terms"], 400))
+            lines.append("")
+        return "\n".join(lines)
+
+    def tool_read_note(self, arguments):
+        target = (self.vault / arguments.get("path", "")).resolve()
+        if self.vault not in target.parents or target.suffix != ".md":
+            raise ValueError("Path must point to a Markdown note inside the vault")
+        return target.read_text(encoding="utf-8", errors="replace")
+
+    def tool_get_vault_stats(self, arguments):
+        self.refresh()
+        return json.dumps(self.index.stats(), indent=2)
+
+    def handle(self, message):
+        method = message.get("method")
+        params = message.get("params") or {}
+
+        if method == "initialize":
+            return {
+                "protocolVersion": (
+                    params["protocolVersion"]
+                    if params.get("protocolVersion") in SUPPORTED_PROTOCOL_VERSIONS
+                    else PROTOCOL_VERSION
+                ),
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": SERVER_NAME, "version": SERVER_VERSION},
+            }
+        if method == "ping":
+            return {}
+        if method == "tools/list":
+            return {"tools": TOOLS}
+        if method == "tools/call":
+            handler = getattr(self, f"tool_{params.get('name')}", None)
+            if handler is None:
+                return {"content": [{"type": "text", "text": f"Unknown tool: {params.get('name')}"}], "isError": True}
+            try:
+                text = handler(params.get("arguments") or {})
+                return {"content": [{"type": "text", "text": text}], "isError": False}
+            except (OSError, ValueError) as e:
+                return {"content": [{"type": "text", "text": str(e)}], "isError": True}
+        raise LookupError(f"Method not found: {method}")
+
+    def serve(self):
+        self.refresh(force=True)
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                self.send({"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}})
+                continue
+            if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+                request_id = message.get("id") if isinstance(message, dict) else None
+                self.send({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32600, "message": "Invalid Request"}})
+                continue
+            if "id" not in message:
+                continue  # Notifications need no response
+
+            try:
+                reply = {"jsonrpc": "2.0", "id": message["id"], "result": self.handle(message)}
+            except LookupError as e:
+                reply = {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32601, "message": str(e)}}
+            except Exception as e:
+                reply = {"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32603, "message": str(e)}}
+            self.send(reply)
+
+    @staticmethod
+    def send(message):
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def cmd_build(args):
+    try:
+        index = VaultIndex(args.index)
+    except sqlite3.OperationalError as e:
+        if args.quiet:
+            return
+        print(f"Cannot open index {args.index}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    vault = resolve_vault(args, index)
+    if vault is None or not vault.is_dir():
+        print(f"Vault not found: {vault or '(set --vault or OBSIDIAN_VAULT_PATH)'}", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        # Hooks must not stall session start behind another instance's rebuild
+        stats = index.build(vault, wait=not args.quiet)
+    except sqlite3.OperationalError as e:
+        if args.quiet:
+            return
+        print(f"Index update failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        index.close()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if not args.quiet:
+        print(f"Indexed {vault}: {stats['added']} added, {stats['updated']} updated, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged ({elapsed:.0f}ms)")
+
+
+def cmd_query(args):
+    if not Path(args.index).exists():
+        print(f"Index not found: {args.index} (run 'vault-index.py build' first)", file=sys.stderr)
+        sys.exit(1)
+    index = VaultIndex(args.index, readonly=True)
+    results = index.search(" ".join(args.text), limit=args.limit)
+    index.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print("No matching notes.")
+        return
+    for result in results:
+        tags = f"  #{' #'.join(result['tags'])}" if result["tags"] else ""
+        print(f"{result['score']:>8.2f}  {result['path']}{tags}")
+
+
+def cmd_stats(args):
+    if not Path(args.index).exists():
+        print(f"Index not found: {args.index}", file=sys.stderr)
+        sys.exit(1)
+    index = VaultIndex(args.index, readonly=True)
+    for key, value in index.stats().items():
+        print(f"{key + ':':<10} {value}")
+    index.close()
+
+
+def cmd_serve(args):
+    index = VaultIndex(args.index)
+    vault = resolve_vault(args, index)
+    if vault is None or not vault.is_dir():
+        print(f"Vault not found: {vault or '(set --vault or OBSIDIAN_VAULT_PATH)'}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        McpServer(index, vault).serve()
+    finally:
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Obsidian vault index")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX), help=f"Index file (default: {DEFAULT_INDEX})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build", help="Create or incrementally refresh the index")
+    p.add_argument("--vault", help="Vault path (default: $OBSIDIAN_VAULT_PATH or last indexed vault)")
+    p.add_argument("--quiet", action="store_true", help="No output; skip if another instance is rebuilding (for SessionStart hooks)")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("query", help="Search the index")
+    p.add_argument("text", nargs="+", help="Search text")
+    p.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
+    p.add_argument("--json", action="store_true", help="Print results as JSON")
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser("stats", help="Show index statistics")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("hook", help="UserPromptSubmit hook: inject related note excerpts")
+    p.add_argument("--limit", type=int, default=HOOK_LIMIT, help=f"Notes to attach (default: {HOOK_LIMIT})")
+    p.add_argument("--max-chars", type=int, default=HOOK_MAX_CHARS,
+                   help=f"Character cap for injected excerpts (default: {HOOK_MAX_CHARS})")
+    p.add_argument("--budget-ms", type=float, default=HOOK_BUDGET_MS,
+                   help=f"Skip injection when the search exceeds this time (default: {HOOK_BUDGET_MS})")
+    p.set_defaults(func=cmd_hook)
+
+    p = sub.add_parser("serve", help="Run as a stdio MCP server")
+    p.add_argument("--vault", help="Vault path (default: $OBSIDIAN_VAULT_PATH or last indexed vault)")
+    p.set_defaults(func=cmd_serve)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()